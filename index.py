@@ -23,33 +23,93 @@ Exit codes:
 """
 
 import sys
-import json
-import io
 import os
 import time
+import zlib
+from typing import TYPE_CHECKING
 
-# Force UTF-8 output on Windows to handle Unicode characters in transcripts
-sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
-sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
+# Force UTF-8 output on Windows to handle Unicode characters in messages.
+# The transcript itself is written to stdout as UTF-8 bytes. Other platforms
+# already default to UTF-8, so the streams are left untouched there.
+if sys.platform == "win32":
+    sys.stdout.reconfigure(encoding="utf-8")
+    sys.stderr.reconfigure(encoding="utf-8")
 
-from youtube_transcript_api import (
-    YouTubeTranscriptApi,
-    NoTranscriptFound,
-    TranscriptsDisabled,
-    VideoUnavailable,
-    InvalidVideoId,
-    RequestBlocked,
-    IpBlocked,
-)
+import orjson
+
+# youtube_transcript_api (and the requests/urllib3 stack behind it) is
+# imported lazily in get_api/fetch_transcript, so cache hits never load it
+if TYPE_CHECKING:
+    from youtube_transcript_api import YouTubeTranscriptApi
 
 from utils.extract_video_id import extract_video_id
-from utils.format_transcript import format_transcript
-from utils.chunk_transcript import chunk_transcript
+from utils.chunk_transcript import iter_chunks
 
 # --- Cache config ---
 # Cache directory lives inside the skill folder
 CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache")
 CACHE_TTL_SECONDS = 7 * 24 * 3600  # 7 days
+# Cached JSON is zlib-compressed — transcripts shrink several-fold, so reads
+# touch far less disk. Entries left over in the old plain .json format are
+# migrated to the compressed format the first time they are looked up.
+CACHE_EXT = ".json.z"
+LEGACY_CACHE_EXT = ".json"
+# Videos with no usable transcript (captions disabled, private, deleted) are
+# remembered for a short while so repeat requests skip the network entirely.
+# Temporary failures such as YouTube blocking requests are never cached.
+NEGATIVE_CACHE_EXT = ".neg.json"
+NEGATIVE_CACHE_TTL_SECONDS = 3600  # 1 hour
+
+# Shared API client, created on first use. It owns the HTTP session, so
+# reusing it keeps connections alive across fetches in the same process.
+_api = None
+
+
+def _read_fresh_cache_file(cache_file: str, ttl_seconds: int) -> bytes | None:
+    """
+    Read a cache file's raw bytes if it exists and is younger than ttl_seconds.
+
+    Expired files are removed. Returns None on a miss or any read failure.
+    """
+    try:
+        # Any stat failure (missing file, permissions, ...) is just a miss
+        st = os.stat(cache_file)
+
+        # Check if cache has expired before reading it — the file's mtime is
+        # its write time, so stale entries are dropped without a JSON parse
+        if time.time() - st.st_mtime > ttl_seconds:
+            os.remove(cache_file)
+            return None
+
+        with open(cache_file, "rb") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _write_cache_file(cache_file: str, data: bytes, mtime: float | None = None) -> None:
+    """
+    Atomically write raw bytes to a cache file. Failures are ignored.
+
+    If mtime is given, the file's modification time is set to it, so the
+    entry keeps the age it had elsewhere (the TTL is measured from mtime).
+    """
+    # Write to a temp file and swap it in, so a crash mid-write never
+    # leaves a truncated cache file behind
+    tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(tmp_file, "wb") as f:
+            f.write(data)
+        os.replace(tmp_file, cache_file)
+        if mtime is not None:
+            os.utime(cache_file, (mtime, mtime))
+    except OSError:
+        # Cache write failure is non-critical
+        try:
+            os.remove(tmp_file)
+        except OSError:
+            pass
 
 
 def get_cached_transcript(video_id: str) -> list | None:
@@ -59,34 +119,99 @@ def get_cached_transcript(video_id: str) -> list | None:
     Returns:
         List of transcript segment dicts if cached and not expired, else None.
     """
-    cache_file = os.path.join(CACHE_DIR, f"{video_id}.json")
-    if not os.path.exists(cache_file):
-        return None
+    cache_file = os.path.join(CACHE_DIR, f"{video_id}{CACHE_EXT}")
+    data = _read_fresh_cache_file(cache_file, CACHE_TTL_SECONDS)
+    if data is None:
+        return _migrate_legacy_cache(video_id)
 
     try:
-        with open(cache_file, "r", encoding="utf-8") as f:
-            cached = json.load(f)
-
-        # Check if cache has expired
-        cached_at = cached.get("cached_at", 0)
-        if time.time() - cached_at > CACHE_TTL_SECONDS:
-            os.remove(cache_file)
-            return None
-
+        cached = orjson.loads(zlib.decompress(data))
         return cached.get("segments", None)
-    except (json.JSONDecodeError, OSError):
+    except (orjson.JSONDecodeError, zlib.error):
         return None
 
 
-def save_to_cache(video_id: str, segments: list) -> None:
-    """Save transcript segments to the local cache."""
-    os.makedirs(CACHE_DIR, exist_ok=True)
-    cache_file = os.path.join(CACHE_DIR, f"{video_id}.json")
+def _migrate_legacy_cache(video_id: str) -> list | None:
+    """
+    Read a pre-compression <id>.json cache entry and move it to the new format.
+
+    The legacy file is always removed, so old entries never linger in the
+    cache directory. A fresh entry is re-saved compressed with its original
+    cached_at time, so migration does not extend its TTL.
+
+    Returns:
+        List of transcript segment dicts if a fresh legacy entry existed, else None.
+    """
+    legacy_file = os.path.join(CACHE_DIR, f"{video_id}{LEGACY_CACHE_EXT}")
+    data = _read_fresh_cache_file(legacy_file, CACHE_TTL_SECONDS)
+    if data is None:
+        return None
+
     try:
-        with open(cache_file, "w", encoding="utf-8") as f:
-            json.dump({"video_id": video_id, "cached_at": time.time(), "segments": segments}, f)
+        os.remove(legacy_file)
     except OSError:
-        pass  # Cache write failure is non-critical
+        pass
+
+    try:
+        cached = orjson.loads(data)
+    except orjson.JSONDecodeError:
+        return None
+
+    segments = cached.get("segments", None)
+    if segments is not None:
+        save_to_cache(video_id, segments, cached_at=cached.get("cached_at", None))
+    return segments
+
+
+def save_to_cache(video_id: str, segments: list, cached_at: float | None = None) -> None:
+    """
+    Save transcript segments to the local cache.
+
+    cached_at backdates an entry being carried over from elsewhere (it also
+    becomes the file's mtime); by default the entry is stamped as new.
+    """
+    cache_file = os.path.join(CACHE_DIR, f"{video_id}{CACHE_EXT}")
+    # A new entry's mtime is already its write time; only backdated ones need it set
+    mtime = cached_at
+    if cached_at is None:
+        cached_at = time.time()
+    payload = {"video_id": video_id, "cached_at": cached_at, "segments": segments}
+    _write_cache_file(cache_file, zlib.compress(orjson.dumps(payload)), mtime=mtime)
+
+
+def get_cached_error(video_id: str) -> str | None:
+    """
+    Check if this video recently failed with a permanent "no transcript" error.
+
+    Returns:
+        The cached user-friendly error message if not expired, else None.
+    """
+    cache_file = os.path.join(CACHE_DIR, f"{video_id}{NEGATIVE_CACHE_EXT}")
+    data = _read_fresh_cache_file(cache_file, NEGATIVE_CACHE_TTL_SECONDS)
+    if data is None:
+        return None
+
+    try:
+        return orjson.loads(data).get("error", None)
+    except orjson.JSONDecodeError:
+        return None
+
+
+def save_error_to_cache(video_id: str, message: str) -> None:
+    """Remember a permanent fetch failure for this video in the local cache."""
+    cache_file = os.path.join(CACHE_DIR, f"{video_id}{NEGATIVE_CACHE_EXT}")
+    payload = {"video_id": video_id, "cached_at": time.time(), "error": message}
+    _write_cache_file(cache_file, orjson.dumps(payload))
+
+
+def get_api() -> "YouTubeTranscriptApi":
+    """Return the shared YouTubeTranscriptApi client, creating it on first use."""
+    global _api
+    if _api is None:
+        from youtube_transcript_api import YouTubeTranscriptApi
+
+        _api = YouTubeTranscriptApi()
+    return _api
 
 
 def fetch_transcript(video_id: str) -> list:
@@ -94,8 +219,8 @@ def fetch_transcript(video_id: str) -> list:
     Fetch the transcript for a YouTube video using youtube-transcript-api v1.x.
 
     Strategy:
-      1. Try English transcript first
-      2. If not found, list all available transcripts and pick the first one
+      1. List the available transcripts once
+      2. Pick English if present, otherwise the first one in any language
          (non-English is fine — the LLM will handle translation)
 
     Args:
@@ -107,49 +232,58 @@ def fetch_transcript(video_id: str) -> list:
     Raises:
         RuntimeError: With a user-friendly message describing the failure.
     """
-    api = YouTubeTranscriptApi()
+    from youtube_transcript_api import (
+        NoTranscriptFound,
+        TranscriptsDisabled,
+        VideoUnavailable,
+        InvalidVideoId,
+        RequestBlocked,
+        IpBlocked,
+    )
+
+    api = get_api()
 
-    # --- Attempt 1: fetch English transcript directly ---
     try:
-        result = api.fetch(video_id, languages=["en"])
-        return result.to_raw_data()
-    except NoTranscriptFound:
-        # English not available — try fallback below
-        pass
+        # A single listing call serves both the English lookup and the fallback
+        transcript_list = api.list(video_id)
+        try:
+            transcript = transcript_list.find_transcript(["en"])
+        except NoTranscriptFound:
+            # English not available — pick the first available (any language)
+            transcript = next(iter(transcript_list), None)
+
+        if transcript is not None:
+            return transcript.fetch().to_raw_data()
     except TranscriptsDisabled:
-        raise RuntimeError(
+        message = (
             f"Transcripts are disabled for video '{video_id}'. "
             "The video owner has turned off captions."
         )
+        save_error_to_cache(video_id, message)
+        raise RuntimeError(message)
     except VideoUnavailable:
-        raise RuntimeError(
+        message = (
             f"Video '{video_id}' is unavailable. "
             "It may be private, deleted, or region-restricted."
         )
+        save_error_to_cache(video_id, message)
+        raise RuntimeError(message)
     except InvalidVideoId:
-        raise RuntimeError(
-            f"'{video_id}' is not a valid YouTube video ID."
-        )
+        message = f"'{video_id}' is not a valid YouTube video ID."
+        save_error_to_cache(video_id, message)
+        raise RuntimeError(message)
     except (RequestBlocked, IpBlocked):
         raise RuntimeError(
             "YouTube is blocking requests right now. "
             "This is usually temporary — please try again in a few minutes."
         )
 
-    # --- Attempt 2: list all transcripts and pick the first available ---
-    try:
-        transcript_list = api.list(video_id)
-        # Pick the first available transcript (any language)
-        for transcript in transcript_list:
-            result = transcript.fetch()
-            return result.to_raw_data()
-    except Exception:
-        pass
-
-    raise RuntimeError(
+    message = (
         f"Could not fetch any transcript for video '{video_id}'. "
         "The video may not have captions/subtitles available."
     )
+    save_error_to_cache(video_id, message)
+    raise RuntimeError(message)
 
 
 def main():
@@ -175,6 +309,11 @@ def main():
         # Check cache first
         transcript_segments = get_cached_transcript(video_id)
         if transcript_segments is None:
+            # A recent permanent failure is reported without a network call
+            cached_error = get_cached_error(video_id)
+            if cached_error is not None:
+                raise RuntimeError(cached_error)
+
             transcript_segments = fetch_transcript(video_id)
             save_to_cache(video_id, transcript_segments)
     except RuntimeError as e:
@@ -185,21 +324,20 @@ def main():
         print(f"ERROR: An unexpected error occurred: {e}", file=sys.stderr)
         sys.exit(1)
 
-    # --- Format transcript ---
-    formatted = format_transcript(transcript_segments)
+    # --- Format and chunk transcript in one pass ---
+    chunks = list(iter_chunks(transcript_segments))
 
-    if not formatted:
+    if not chunks:
         print("ERROR: Transcript was fetched but appears to be empty.", file=sys.stderr)
         sys.exit(1)
 
-    # --- Chunk if needed ---
-    chunks = chunk_transcript(formatted)
-
     # --- Output ---
     # If single chunk, print plain text
     # If multiple chunks, print as JSON object so the LLM knows it's chunked
+    # Either way the payload is written as UTF-8 bytes straight to the
+    # underlying buffer, skipping the text layer.
     if len(chunks) == 1:
-        print(chunks[0])
+        payload = chunks[0].encode("utf-8")
     else:
         output = {
             "video_id": video_id,
@@ -207,7 +345,10 @@ def main():
             "note": "This transcript was split into chunks because the video is long. Process all chunks.",
             "chunks": chunks,
         }
-        print(json.dumps(output, indent=2))
+        payload = orjson.dumps(output)
+
+    sys.stdout.buffer.write(payload)
+    sys.stdout.buffer.write(b"\n")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,32 @@
+from utils.chunk_transcript import chunk_transcript, iter_chunks
+from utils.format_transcript import format_transcript
+
+SEGMENTS = [
+    {"text": "z" * 40, "start": 3630.0, "duration": 2.0},
+    {"text": "a", "start": 3663.0, "duration": 2.0},
+]
+
+
+def test_iter_chunks_keeps_transcript_of_exactly_max_chars_whole():
+    formatted = format_transcript(SEGMENTS)
+    assert list(iter_chunks(SEGMENTS, max_chars=len(formatted))) == [formatted]
+
+
+def test_iter_chunks_splits_transcript_one_char_over_max_chars():
+    formatted = format_transcript(SEGMENTS)
+    chunks = list(iter_chunks(SEGMENTS, max_chars=len(formatted) - 1))
+    assert chunks == formatted.split("\n")
+
+
+def test_iter_chunks_empty_transcript():
+    assert list(iter_chunks([])) == []
+
+
+def test_iter_chunks_matches_chunk_transcript():
+    segments = [
+        {"text": f"line {i} " + "x" * (i % 37), "start": i * 7.5, "duration": 7.5}
+        for i in range(600)
+    ]
+    formatted = format_transcript(segments)
+    for max_chars in (1, 50, 333, 4000, len(formatted)):
+        assert list(iter_chunks(segments, max_chars)) == chunk_transcript(formatted, max_chars)
@@ -0,0 +1,18 @@
+from utils.format_transcript import format_transcript, seconds_to_timestamp
+
+
+def test_seconds_to_timestamp():
+    assert seconds_to_timestamp(59.9) == "00:59"
+    assert seconds_to_timestamp(3599.9) == "59:59"
+    assert seconds_to_timestamp(3661.2) == "01:01:01"
+    assert seconds_to_timestamp(-5) == "00:00"
+
+
+def test_format_transcript_handles_out_of_order_and_negative_starts():
+    segments = [
+        {"text": "late", "start": 4000.0, "duration": 1.0},
+        {"text": "early", "start": -3.0, "duration": 1.0},
+        {"text": "  ", "start": 5.0, "duration": 1.0},
+        {"text": "end", "start": 10.0, "duration": 1.0},
+    ]
+    assert format_transcript(segments) == "[01:06:40] late\n[00:00] early\n[00:10] end"
@@ -0,0 +1,215 @@
+import json
+import os
+import sys
+import time
+import types
+
+import pytest
+
+import index
+
+VIDEO_ID = "dQw4w9WgXcQ"
+SEGMENTS = [{"text": "hello", "start": 1.0, "duration": 2.0}]
+
+
+class FakeTranscript:
+    def __init__(self, language_code, segments):
+        self.language_code = language_code
+        self.segments = segments
+
+    def fetch(self):
+        return types.SimpleNamespace(to_raw_data=lambda: self.segments)
+
+
+class FakeTranscriptList:
+    def __init__(self, api_module, transcripts):
+        self.api_module = api_module
+        self.transcripts = transcripts
+
+    def find_transcript(self, language_codes):
+        for transcript in self.transcripts:
+            if transcript.language_code in language_codes:
+                return transcript
+        raise self.api_module.NoTranscriptFound(VIDEO_ID)
+
+    def __iter__(self):
+        return iter(self.transcripts)
+
+
+class FakeApi:
+    def __init__(self, transcript_list=None, error=None):
+        self.transcript_list = transcript_list
+        self.error = error
+
+    def list(self, video_id):
+        if self.error is not None:
+            raise self.error
+        return self.transcript_list
+
+
+@pytest.fixture
+def api_module(monkeypatch):
+    """Install a stand-in youtube_transcript_api exposing its exception types."""
+    module = types.ModuleType("youtube_transcript_api")
+    for name in (
+        "NoTranscriptFound",
+        "TranscriptsDisabled",
+        "VideoUnavailable",
+        "InvalidVideoId",
+        "RequestBlocked",
+        "IpBlocked",
+    ):
+        setattr(module, name, type(name, (Exception,), {}))
+    monkeypatch.setitem(sys.modules, "youtube_transcript_api", module)
+    return module
+
+
+@pytest.fixture
+def cache_dir(monkeypatch, tmp_path):
+    monkeypatch.setattr(index, "CACHE_DIR", str(tmp_path))
+    return tmp_path
+
+
+def use_api(monkeypatch, api):
+    monkeypatch.setattr(index, "get_api", lambda: api)
+
+
+def run_main(monkeypatch, *args):
+    monkeypatch.setattr(sys, "argv", ["index.py", *args])
+    with pytest.raises(SystemExit) as exc_info:
+        index.main()
+    return exc_info.value.code
+
+
+# --- Negative cache ---
+
+
+def test_fresh_negative_entry_short_circuits_main(monkeypatch, capsys, cache_dir):
+    index.save_error_to_cache(VIDEO_ID, "Transcripts are disabled for this video.")
+
+    def no_network():
+        raise AssertionError("get_api() must not be called on a negative-cache hit")
+
+    monkeypatch.setattr(index, "get_api", no_network)
+
+    assert run_main(monkeypatch, VIDEO_ID) == 1
+    assert capsys.readouterr().err == "ERROR: Transcripts are disabled for this video.\n"
+
+
+def test_expired_negative_entry_is_removed_and_ignored(cache_dir):
+    index.save_error_to_cache(VIDEO_ID, "Transcripts are disabled for this video.")
+    neg_file = cache_dir / f"{VIDEO_ID}{index.NEGATIVE_CACHE_EXT}"
+    expired = time.time() - index.NEGATIVE_CACHE_TTL_SECONDS - 60
+    os.utime(neg_file, (expired, expired))
+
+    assert index.get_cached_error(VIDEO_ID) is None
+    assert not neg_file.exists()
+
+
+@pytest.mark.parametrize("error_name", ["RequestBlocked", "IpBlocked"])
+def test_blocking_errors_are_not_cached(monkeypatch, api_module, cache_dir, error_name):
+    use_api(monkeypatch, FakeApi(error=getattr(api_module, error_name)(VIDEO_ID)))
+
+    with pytest.raises(RuntimeError, match="blocking requests"):
+        index.fetch_transcript(VIDEO_ID)
+    assert list(cache_dir.iterdir()) == []
+
+
+def test_permanent_error_is_cached(monkeypatch, api_module, cache_dir):
+    use_api(monkeypatch, FakeApi(error=api_module.TranscriptsDisabled(VIDEO_ID)))
+
+    with pytest.raises(RuntimeError, match="Transcripts are disabled") as exc_info:
+        index.fetch_transcript(VIDEO_ID)
+    assert index.get_cached_error(VIDEO_ID) == str(exc_info.value)
+
+
+def test_uncreatable_cache_dir_keeps_friendly_error(monkeypatch, api_module, tmp_path):
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("")
+    monkeypatch.setattr(index, "CACHE_DIR", str(blocker / "cache"))
+    use_api(monkeypatch, FakeApi(error=api_module.TranscriptsDisabled(VIDEO_ID)))
+
+    with pytest.raises(RuntimeError, match="Transcripts are disabled"):
+        index.fetch_transcript(VIDEO_ID)
+
+
+# --- Transcript cache ---
+
+
+def test_cache_round_trip(cache_dir):
+    index.save_to_cache(VIDEO_ID, SEGMENTS)
+
+    assert (cache_dir / f"{VIDEO_ID}{index.CACHE_EXT}").exists()
+    assert index.get_cached_transcript(VIDEO_ID) == SEGMENTS
+
+
+def test_corrupt_cache_entry_is_refetched(monkeypatch, capsysbinary, api_module, cache_dir):
+    (cache_dir / f"{VIDEO_ID}{index.CACHE_EXT}").write_bytes(b"not zlib data")
+    assert index.get_cached_transcript(VIDEO_ID) is None
+
+    transcripts = FakeTranscriptList(api_module, [FakeTranscript("en", SEGMENTS)])
+    use_api(monkeypatch, FakeApi(transcript_list=transcripts))
+    monkeypatch.setattr(sys, "argv", ["index.py", VIDEO_ID])
+    index.main()
+
+    assert capsysbinary.readouterr().out == b"[00:01] hello\n"
+    assert index.get_cached_transcript(VIDEO_ID) == SEGMENTS
+
+
+def test_legacy_cache_entry_is_migrated_without_extending_ttl(cache_dir):
+    cached_at = time.time() - 6 * 24 * 3600
+    legacy_file = cache_dir / f"{VIDEO_ID}{index.LEGACY_CACHE_EXT}"
+    legacy_file.write_text(
+        json.dumps({"video_id": VIDEO_ID, "cached_at": cached_at, "segments": SEGMENTS})
+    )
+    os.utime(legacy_file, (cached_at, cached_at))
+
+    assert index.get_cached_transcript(VIDEO_ID) == SEGMENTS
+    assert not legacy_file.exists()
+
+    cache_file = cache_dir / f"{VIDEO_ID}{index.CACHE_EXT}"
+    assert cache_file.stat().st_mtime == pytest.approx(cached_at)
+    assert index.get_cached_transcript(VIDEO_ID) == SEGMENTS
+
+
+def test_expired_legacy_cache_entry_is_removed(cache_dir):
+    legacy_file = cache_dir / f"{VIDEO_ID}{index.LEGACY_CACHE_EXT}"
+    legacy_file.write_text('{"segments": []}')
+    expired = time.time() - index.CACHE_TTL_SECONDS - 60
+    os.utime(legacy_file, (expired, expired))
+
+    assert index.get_cached_transcript(VIDEO_ID) is None
+    assert list(cache_dir.iterdir()) == []
+
+
+# --- fetch_transcript ---
+
+
+def test_fetch_transcript_prefers_english(monkeypatch, api_module, cache_dir):
+    english = [{"text": "hello", "start": 0.0, "duration": 1.0}]
+    hindi = [{"text": "नमस्ते", "start": 0.0, "duration": 1.0}]
+    transcripts = FakeTranscriptList(
+        api_module, [FakeTranscript("hi", hindi), FakeTranscript("en", english)]
+    )
+    use_api(monkeypatch, FakeApi(transcript_list=transcripts))
+
+    assert index.fetch_transcript(VIDEO_ID) == english
+
+
+def test_fetch_transcript_falls_back_to_first_language(monkeypatch, api_module, cache_dir):
+    hindi = [{"text": "नमस्ते", "start": 0.0, "duration": 1.0}]
+    tamil = [{"text": "வணக்கம்", "start": 0.0, "duration": 1.0}]
+    transcripts = FakeTranscriptList(
+        api_module, [FakeTranscript("hi", hindi), FakeTranscript("ta", tamil)]
+    )
+    use_api(monkeypatch, FakeApi(transcript_list=transcripts))
+
+    assert index.fetch_transcript(VIDEO_ID) == hindi
+
+
+def test_fetch_transcript_with_no_transcripts_raises_and_caches(monkeypatch, api_module, cache_dir):
+    use_api(monkeypatch, FakeApi(transcript_list=FakeTranscriptList(api_module, [])))
+
+    with pytest.raises(RuntimeError, match="Could not fetch any transcript") as exc_info:
+        index.fetch_transcript(VIDEO_ID)
+    assert index.get_cached_error(VIDEO_ID) == str(exc_info.value)
@@ -7,8 +7,16 @@ exceeding context limits.
 
 Default chunk size: ~4000 characters (well within Gemini's limits,
 leaves room for the summary prompt).
+
+iter_chunks fuses formatting and chunking into a single pass over the raw
+segments, so the full formatted transcript is never built in memory.
 """
 
+import itertools
+from collections.abc import Iterator
+
+from utils.format_transcript import iter_formatted_lines
+
 
 def chunk_transcript(transcript_text: str, max_chars: int = 4000) -> list:
     """
@@ -33,24 +41,80 @@ def chunk_transcript(transcript_text: str, max_chars: int = 4000) -> list:
         return [transcript_text]
 
     chunks = []
-    lines = transcript_text.split("\n")
-    current_chunk = []
-    current_length = 0
+    # Walk newline offsets in the original string and slice each chunk out
+    # once, instead of splitting into lines and joining them back together.
+    # Every line before `line_start` counts len(line) + 1 (for its newline),
+    # so the current chunk's length is simply line_start - chunk_start.
+    chunk_start = 0
+    line_start = 0
+
+    while True:
+        newline = transcript_text.find("\n", line_start)
+        line_end = newline if newline != -1 else len(transcript_text)
+
+        # If adding this line would exceed the limit, start a new chunk
+        if line_end + 1 - chunk_start > max_chars and line_start > chunk_start:
+            chunks.append(transcript_text[chunk_start:line_start - 1])
+            chunk_start = line_start
+
+        if newline == -1:
+            break
+        line_start = newline + 1
+
+    # Don't forget the last chunk
+    chunks.append(transcript_text[chunk_start:])
+
+    return chunks
+
 
+def iter_chunks(transcript_segments: list, max_chars: int = 4000) -> Iterator[str]:
+    """
+    Format raw transcript segments and yield them as chunks of ~max_chars.
+
+    Produces the same chunks as chunk_transcript(format_transcript(...)),
+    but chunks while formatting, so the full transcript string is never
+    built. Each chunk is still assembled from a short list of its lines.
+
+    Args:
+        transcript_segments: List of segment dicts (see format_transcript).
+        max_chars: Maximum characters per chunk (default 4000).
+
+    Yields:
+        Formatted transcript chunks. Nothing is yielded for an empty
+        transcript.
+    """
+    lines = iter_formatted_lines(transcript_segments)
+
+    # Like chunk_transcript, a transcript that fits in max_chars is returned
+    # whole. Only the lines up to the first max_chars + 1 characters need to
+    # be held back to decide that.
+    head = []
+    head_length = -1  # joined length: no newline before the first line
     for line in lines:
+        head.append(line)
+        head_length += len(line) + 1
+        if head_length > max_chars:
+            break
+    else:
+        if head:
+            yield "\n".join(head)
+        return
+
+    buffer = []
+    current_length = 0
+
+    for line in itertools.chain(head, lines):
         line_length = len(line) + 1  # +1 for the newline character
 
         # If adding this line would exceed the limit, start a new chunk
-        if current_length + line_length > max_chars and current_chunk:
-            chunks.append("\n".join(current_chunk))
-            current_chunk = []
+        if current_length + line_length > max_chars and buffer:
+            yield "\n".join(buffer)
+            buffer.clear()
             current_length = 0
 
-        current_chunk.append(line)
+        buffer.append(line)
         current_length += line_length
 
     # Don't forget the last chunk
-    if current_chunk:
-        chunks.append("\n".join(current_chunk))
-
-    return chunks
+    if buffer:
+        yield "\n".join(buffer)
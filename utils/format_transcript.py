@@ -8,17 +8,56 @@ Each segment becomes:
   [MM:SS] Text of the segment...
 """
 
+from collections.abc import Iterator
+from operator import itemgetter
+
+_start_and_text = itemgetter("start", "text")
+
+# "MM:SS" strings for every whole second under an hour, built on first use
+_mmss_timestamps = None
+
+
+def _get_mmss_timestamps() -> tuple:
+    """Return the sub-hour timestamp lookup table, building it if needed."""
+    global _mmss_timestamps
+    if _mmss_timestamps is None:
+        _mmss_timestamps = tuple(
+            f"{mins:02d}:{secs:02d}" for mins in range(60) for secs in range(60)
+        )
+    return _mmss_timestamps
+
 
 def seconds_to_timestamp(seconds: float) -> str:
-    """Convert seconds (float) to MM:SS or HH:MM:SS format."""
-    total = int(seconds)
-    hrs = total // 3600
-    mins = (total % 3600) // 60
-    secs = total % 60
+    """Convert seconds (float) to MM:SS or HH:MM:SS format (negatives clamp to 00:00)."""
+    total = max(int(seconds), 0)
+    if total < 3600:
+        return _get_mmss_timestamps()[total]
+
+    mins, secs = divmod(total, 60)
+    hrs, mins = divmod(mins, 60)
+    return f"{hrs:02d}:{mins:02d}:{secs:02d}"
+
+
+def iter_formatted_lines(transcript_segments: list) -> Iterator[str]:
+    """
+    Lazily format raw transcript segments, one timestamped line at a time.
+
+    Empty segments are skipped. Shared by format_transcript and the fused
+    formatter/chunker in chunk_transcript.py.
+    """
+    if not transcript_segments:
+        return iter(())
 
-    if hrs > 0:
-        return f"{hrs:02d}:{mins:02d}:{secs:02d}"
-    return f"{mins:02d}:{secs:02d}"
+    # Unpack both fields per segment in C rather than with two subscripts
+    pairs = map(_start_and_text, transcript_segments)
+
+    # seconds_to_timestamp serves sub-hour stamps from its lookup table, so
+    # every segment goes through it regardless of order or range
+    return (
+        f"[{seconds_to_timestamp(start)}] {text}"
+        for start, raw_text in pairs
+        if (text := raw_text.strip())  # skip empty segments
+    )
 
 
 def format_transcript(transcript_segments: list) -> str:
@@ -37,14 +76,4 @@ def format_transcript(transcript_segments: list) -> str:
             [00:05] Second line of captions
             ...
     """
-    if not transcript_segments:
-        return ""
-
-    lines = []
-    for segment in transcript_segments:
-        timestamp = seconds_to_timestamp(segment["start"])
-        text = segment["text"].strip()
-        if text:  # skip empty segments
-            lines.append(f"[{timestamp}] {text}")
-
-    return "\n".join(lines)
+    return "\n".join(iter_formatted_lines(transcript_segments))